@@ -32,14 +32,14 @@ async def create_collection_if_not_exists(collection_name: str = "docs"):
     """
     try:
         # Check if collection exists
-        collections = qdrant_client.get_collections()
+        collections = await qdrant_client.get_collections()
         collection_names = [col.name for col in collections.collections]
         
         if collection_name not in collection_names:
             logger.info(f"Creating collection: {collection_name}")
             
             # Create collection with vector configuration
-            qdrant_client.create_collection(
+            await qdrant_client.create_collection(
                 collection_name=collection_name,
                 vectors_config={
                     "size": 1536,  # OpenAI text-embedding-ada-002 dimension
@@ -91,7 +91,7 @@ async def upload_chunks_to_qdrant(chunks: List[Dict[str, str]], collection_name:
                 max_retries = 3
                 for retry in range(max_retries):
                     try:
-                        qdrant_client.upsert(
+                        await qdrant_client.upsert(
                             collection_name=collection_name,
                             points=[point]
                         )
@@ -13,6 +13,7 @@ ENHANCED ANSWER QUALITY VALIDATION:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi.responses import StreamingResponse
 from services.db import (
     fetch_interactions_for_session, fetch_user_history, get_db, fetch_base_question, get_available_topics, 
     save_user_ai_interaction, validate_user_id, get_interview_session, update_interview_session_answer,
@@ -23,9 +24,10 @@ from services.interview_flow import InterviewFlowManager
 from services.feedback_service import FeedbackService
 from services.user_session_service import UserSessionService
 from models.schemas import InterviewInit, AnswerRequest, ClarificationRequest
+import asyncio
 import logging
 from datetime import datetime
-from services.rag.retriever_factory import get_rag_retriever
+from services.rag.context_cache import get_cached_rag_context
 
 logger = logging.getLogger(__name__)
 
@@ -70,11 +72,18 @@ async def submit_answer(answer_request: AnswerRequest = Body(...)):
         if current_phase == "coding":
             return await _handle_coding_phase(answer_request, session, session_data)
         
-        # Update session with user's answer
-        await update_interview_session_answer(session_id, answer_request.answer, False)
-        
-        # Get RAG context
-        rag_context = await _get_rag_context(session_data["topic"])
+        # Reuse the RAG context retrieved at init - the topic never changes
+        # within a session. Sessions created before the context was stored,
+        # or whose init-time retrieval failed and stored an empty string,
+        # fall back to a fetch, overlapped with persisting the answer.
+        rag_context = session_data.get("rag_context")
+        if rag_context:
+            await update_interview_session_answer(session_id, answer_request.answer, False, session=session)
+        else:
+            _, rag_context = await asyncio.gather(
+                update_interview_session_answer(session_id, answer_request.answer, False, session=session),
+                _get_rag_context(session_data["topic"])
+            )
         
         # Process answer using flow manager
         flow_manager = InterviewFlowManager(session_data, session_id)
@@ -99,17 +108,13 @@ async def _handle_coding_phase(answer_request: AnswerRequest, session: dict, ses
         flow_manager = InterviewFlowManager(session_data, answer_request.session_id)
         result = await flow_manager.handle_coding_phase(answer_request.answer, True)
         
-        # Update session with clarification count
+        # Update clarification count on the in-memory session; it gets persisted
+        # together with the clarification in the single write below
         if "clarification_count" in result:
-            from services.db import get_db
-            db = await get_db()
-            await db.user_ai_interactions.update_one(
-                {"session_id": answer_request.session_id},
-                {"$set": {"meta.session_data.coding_clarification_count": result["clarification_count"]}}
-            )
-        
+            session_data["coding_clarification_count"] = result["clarification_count"]
+
         # Update session with answer
-        await update_interview_session_answer(answer_request.session_id, answer_request.answer, True)
+        await update_interview_session_answer(answer_request.session_id, answer_request.answer, True, session=session)
         
         # Add language field
         result["language"] = session["ai_response"].get("language", "")
@@ -117,7 +122,7 @@ async def _handle_coding_phase(answer_request: AnswerRequest, session: dict, ses
         return result
     else:
         # Handle final code submission
-        await update_interview_session_answer(answer_request.session_id, answer_request.answer, False)
+        await update_interview_session_answer(answer_request.session_id, answer_request.answer, False, session=session)
         
         # Mark session as completed
         session_data["status"] = "completed"
@@ -140,13 +145,10 @@ async def _handle_coding_phase(answer_request: AnswerRequest, session: dict, ses
 async def _get_rag_context(topic: str) -> str:
     """Get RAG context for the given topic."""
     try:
-        retriever = await get_rag_retriever()
-        if retriever:
-            context_chunks = await retriever.retrieve_context(topic)
-            return "\n\n".join(context_chunks)
+        return await get_cached_rag_context(topic)
     except Exception as e:
         logger.warning(f"Failed to get RAG context: {e}")
-    
+
     return ""
 
 @router.post("/feedback/{session_id}")
@@ -171,6 +173,32 @@ async def get_interview_feedback(session_id: str, code_submission: dict = Body(d
         logger.error(f"Error getting feedback: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/feedback/{session_id}/stream")
+async def stream_interview_feedback(session_id: str, code_submission: dict = Body(default=None)):
+    """
+    Stream feedback for a completed interview session as server-sent events.
+    Tokens are emitted as they are generated so clients can render feedback
+    immediately instead of waiting for the full document; the final parsed
+    feedback arrives in a 'complete' event and is persisted as usual.
+    """
+    try:
+        session = await get_interview_session(session_id)
+        if not session:
+            logger.error(f"Session not found: {session_id}")
+            raise HTTPException(status_code=404, detail="Interview session not found")
+
+        feedback_service = FeedbackService(session)
+        return StreamingResponse(
+            feedback_service.stream_interview_feedback(code_submission),
+            media_type="text/event-stream"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming feedback: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/topics")
 async def get_topics():
     """
@@ -27,6 +27,7 @@ from .interview_sessions import (
     transition_to_coding_phase,
     save_interview_feedback,
     get_user_interview_sessions,
+    get_user_interview_session_summaries,
     reconstruct_session_state
 )
 
@@ -34,6 +35,7 @@ from .interview_sessions import (
 from .personalization import (
     get_personalized_context,
     get_enhanced_personalized_context,
+    get_feedback_bootstrap,
     extract_interaction_patterns,
     generate_enhanced_guidance,
     analyze_user_patterns
@@ -45,7 +47,8 @@ from .question_bank import (
     fetch_question_by_module,
     get_available_topics,
     get_available_modules,
-    get_user_name_from_id
+    get_user_name_from_id,
+    invalidate_user_name
 )
 
 # Export all functions for backward compatibility
@@ -72,11 +75,13 @@ __all__ = [
     "transition_to_coding_phase",
     "save_interview_feedback",
     "get_user_interview_sessions",
+    "get_user_interview_session_summaries",
     "reconstruct_session_state",
     
     # Personalization
     "get_personalized_context",
     "get_enhanced_personalized_context",
+    "get_feedback_bootstrap",
     "extract_interaction_patterns",
     "generate_enhanced_guidance",
     "analyze_user_patterns",
@@ -86,5 +91,6 @@ __all__ = [
     "fetch_question_by_module",
     "get_available_topics",
     "get_available_modules",
-    "get_user_name_from_id"
+    "get_user_name_from_id",
+    "invalidate_user_name"
 ] 
\ No newline at end of file
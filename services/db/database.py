@@ -8,6 +8,7 @@ Handles MongoDB connection, index creation, and user validation.
 import os
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure
 from bson import ObjectId
 from datetime import datetime
 
@@ -61,9 +62,13 @@ async def create_indexes():
         
         # Create indexes for user_ai_interactions collection
         await db.user_ai_interactions.create_index([("user_id", 1)])
-        await db.user_ai_interactions.create_index([("session_id", 1)])
+        await _ensure_session_id_index(db)
         await db.user_ai_interactions.create_index([("timestamp", -1)])
         await db.user_ai_interactions.create_index([("endpoint", 1)])
+        # Compound indexes covering the history queries: user timeline and
+        # per-session-type timeline both sort newest-first
+        await db.user_ai_interactions.create_index([("user_id", 1), ("timestamp", -1)])
+        await db.user_ai_interactions.create_index([("user_id", 1), ("meta.session_type", 1), ("timestamp", -1)])
         
         # Create indexes for users collection
         await db.users.create_index([("_id", 1)])
@@ -83,6 +88,47 @@ async def create_indexes():
         logger.error(f"Error creating indexes: {str(e)}")
         raise
 
+async def _ensure_session_id_index(db):
+    """
+    Ensure a unique partial session_id index on user_ai_interactions.
+    Unique so a duplicate session can never be created; partial because
+    non-interview interaction documents have no session_id and duplicate
+    missing values would otherwise collide.
+
+    Existing deployments carry a non-unique session_id_1 index created by
+    earlier versions of create_indexes, and re-creating it with different
+    options would fail with IndexOptionsConflict. The replacement is built
+    under its own name first and the legacy index is only dropped once the
+    replacement exists, so a failed migration (e.g. duplicate session_ids
+    already in the data) leaves session lookups indexed instead of falling
+    back to collection scans. Failures are logged rather than raised so
+    they cannot block startup.
+    """
+    collection = db.user_ai_interactions
+    try:
+        indexes = await collection.index_information()
+        legacy_index = indexes.get("session_id_1")
+        if legacy_index is not None and legacy_index.get("unique"):
+            # Already migrated in place by an earlier build
+            return
+
+        await collection.create_index(
+            [("session_id", 1)],
+            name="session_id_unique",
+            unique=True,
+            partialFilterExpression={"session_id": {"$exists": True}}
+        )
+    except OperationFailure as e:
+        logger.warning(f"Could not create unique session_id index, keeping legacy index: {str(e)}")
+        return
+
+    if legacy_index is not None:
+        try:
+            await collection.drop_index("session_id_1")
+            logger.info("Dropped legacy non-unique session_id index")
+        except OperationFailure as e:
+            logger.warning(f"Could not drop legacy session_id index: {str(e)}")
+
 async def check_collections():
     """
     Check if required collections exist and have data.
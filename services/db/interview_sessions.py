@@ -37,11 +37,14 @@ def reconstruct_session_state(interactions):
                 session_data["question_count"] = session_data.get("question_count", 1) + 1
     return session_data
 
-async def create_interview_session(user_id: str, session_id: str, topic: str, user_name: str, base_question_data: dict, first_follow_up: str, base_question_id=None):
+async def create_interview_session(user_id: str, session_id: str, topic: str, user_name: str, base_question_data: dict, first_follow_up: str, base_question_id=None, rag_context: str = ""):
     """
     Create a new interview session document.
     Initializes session with base question and first follow-up.
     Handles both coding and approach interview types.
+    The retrieved RAG context is stored on the session so follow-up answers
+    can reuse it instead of re-querying the vector store - the topic never
+    changes within a session.
     """
     try:
         db = await get_db()
@@ -102,6 +105,7 @@ async def create_interview_session(user_id: str, session_id: str, topic: str, us
                     "current_phase": "verbal" if interview_type == "coding" else "approach",
                     "interview_type": interview_type,
                     "base_question_id": base_question_id,
+                    "rag_context": rag_context,
                     "total_questions": 1,
                     "questions": [
                         {
@@ -153,16 +157,19 @@ async def get_interview_session(session_id: str):
         logger.error(f"Error getting interview session: {str(e)}", exc_info=True)
         raise
 
-async def update_interview_session_answer(session_id: str, answer: str, is_clarification: bool = False):
+async def update_interview_session_answer(session_id: str, answer: str, is_clarification: bool = False, session: dict = None):
     """
     Update the interview session with a new answer.
     Handles both regular answers and clarification requests.
+    Callers that already hold the session document can pass it in to avoid a
+    redundant read; the mutated session_data is returned either way.
     """
     try:
         db = await get_db()
-        
-        # Get the current session
-        session = await get_interview_session(session_id)
+
+        # Get the current session unless the caller already fetched it
+        if session is None:
+            session = await get_interview_session(session_id)
         if not session:
             raise Exception(f"Session not found: {session_id}")
         
@@ -213,6 +220,7 @@ async def update_interview_session_answer(session_id: str, answer: str, is_clari
         )
         
         logger.info(f"Updated interview session: {session_id} with answer")
+        return session_data
     except Exception as e:
         logger.error(f"Error updating interview session: {str(e)}", exc_info=True)
         raise
@@ -356,8 +364,50 @@ async def get_user_interview_sessions(user_id: str, limit: int = 20):
                 "meta.session_type": "structured"
             }
         ).sort("timestamp", -1).limit(limit).to_list(length=limit)
-        
+
         return sessions
     except Exception as e:
         logger.error(f"Error getting user interview sessions: {str(e)}", exc_info=True)
+        raise
+
+async def get_user_interview_session_summaries(user_id: str, limit: int = 20):
+    """
+    Get summary metadata for a user's interview sessions.
+    Shapes the result server-side with $project so only the listed scalar
+    fields travel over the wire instead of full session documents
+    (conversation, feedback, etc).
+    """
+    try:
+        db = await get_db()
+
+        # Convert string user_id to ObjectId if it's a valid ObjectId format
+        try:
+            object_id = ObjectId(user_id)
+            query_user_id = object_id
+        except:
+            query_user_id = user_id
+
+        pipeline = [
+            {"$match": {"user_id": query_user_id, "meta.session_type": "structured"}},
+            {"$sort": {"timestamp": -1}},
+            {"$limit": limit},
+            {
+                "$project": {
+                    "_id": 0,
+                    "session_id": 1,
+                    "timestamp": 1,
+                    "topic": "$meta.session_data.topic",
+                    "user_name": "$meta.session_data.user_name",
+                    "status": "$meta.session_data.status",
+                    "current_phase": "$meta.session_data.current_phase",
+                    "total_questions": "$meta.session_data.total_questions",
+                    "has_feedback": {"$ne": [{"$ifNull": ["$meta.session_data.feedback", None]}, None]}
+                }
+            }
+        ]
+
+        summaries = await db.user_ai_interactions.aggregate(pipeline).to_list(length=limit)
+        return summaries
+    except Exception as e:
+        logger.error(f"Error getting user interview session summaries: {str(e)}", exc_info=True)
         raise 
\ No newline at end of file
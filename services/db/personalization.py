@@ -5,13 +5,102 @@ This module handles user personalization and pattern analysis.
 Provides functions for analyzing user behavior and generating personalized guidance.
 """
 
+import asyncio
 import logging
 from collections import Counter
+from bson import ObjectId
 from .database import get_db
 from .user_interactions import get_user_interaction_history
 
 logger = logging.getLogger(__name__)
 
+async def get_feedback_bootstrap(user_id: str, current_topic: str = None, question_id: str = None):
+    """
+    Fetch everything the feedback path needs in one round-trip.
+    A single $facet aggregation returns the user's recent interactions and
+    their profile name together (Mongo runs the branches on one snapshot),
+    replacing the separate user-name and history reads. The external progress
+    API call runs concurrently with the aggregation when a question_id is given.
+    """
+    try:
+        db = await get_db()
+
+        # Convert string user_id to ObjectId if it's a valid ObjectId format
+        try:
+            query_user_id = ObjectId(user_id)
+        except:
+            query_user_id = user_id
+
+        pipeline = [
+            {"$match": {"user_id": query_user_id}},
+            {
+                "$facet": {
+                    "recent_interactions": [
+                        {"$sort": {"timestamp": -1}},
+                        {"$limit": 10},
+                        # Pattern extraction never reads the stored RAG
+                        # context, so keep the multi-KB blob out of the facet
+                        {"$project": {"meta.session_data.rag_context": 0}}
+                    ],
+                    "user_profile": [
+                        {"$limit": 1},
+                        {
+                            "$lookup": {
+                                "from": "users",
+                                "localField": "user_id",
+                                "foreignField": "_id",
+                                "as": "user"
+                            }
+                        },
+                        {"$unwind": "$user"},
+                        {"$project": {"_id": 0, "user_name": "$user.user_name"}}
+                    ]
+                }
+            }
+        ]
+
+        async def _run_facet():
+            result = await db.user_ai_interactions.aggregate(pipeline).to_list(length=1)
+            return result[0] if result else {}
+
+        if question_id:
+            from services.llm.utils import check_question_answered_by_id
+            facets, progress_data = await asyncio.gather(
+                _run_facet(),
+                check_question_answered_by_id(user_id, question_id)
+            )
+        else:
+            facets = await _run_facet()
+            progress_data = None
+
+        recent_interactions = facets.get("recent_interactions", [])
+        user_profile = facets.get("user_profile", [])
+        user_name = user_profile[0].get("user_name", "") if user_profile else ""
+
+        # Extract patterns from interactions
+        patterns = await extract_interaction_patterns(recent_interactions, current_topic)
+
+        # Add progress data if available
+        if progress_data and progress_data.get("success"):
+            patterns["question_specific_history"] = {
+                "previous_answer": progress_data["data"].get("answer", ""),
+                "previous_result": progress_data["data"].get("finalResult", None),
+                "previous_output": progress_data["data"].get("output", "")
+            }
+
+        # Generate personalized guidance
+        personalized_guidance = generate_enhanced_guidance(patterns, user_name or None)
+
+        return {
+            "user_name": user_name,
+            "user_patterns": patterns,
+            "personalized_guidance": personalized_guidance,
+            "progress_data": progress_data
+        }
+    except Exception as e:
+        logger.error(f"Error getting feedback bootstrap: {str(e)}", exc_info=True)
+        return {"user_name": "", "user_patterns": {}, "personalized_guidance": "", "progress_data": None}
+
 async def get_enhanced_personalized_context(user_id: str, current_topic: str = None, question_id: str = None, user_name: str = None):
     """
     Get enhanced personalized context using user interaction history.
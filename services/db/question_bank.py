@@ -5,12 +5,55 @@ This module handles question bank operations and topic management.
 Provides functions for fetching questions, topics, and user information.
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from bson import ObjectId
 from .database import get_db
 
 logger = logging.getLogger(__name__)
 
+# TTL + LRU cache for user names - effectively immutable per user, and looked
+# up on every init/answer/feedback/session path
+USER_NAME_CACHE_MAX_SIZE = 10_000
+USER_NAME_CACHE_TTL_SECONDS = 3600
+_user_name_cache = OrderedDict()
+_user_name_cache_lock = asyncio.Lock()
+
+def invalidate_user_name(user_id: str):
+    """
+    Drop a cached user name.
+    Call this if a user's profile name is updated.
+    """
+    _user_name_cache.pop(user_id, None)
+
+# Short-TTL cache for the nearly-static /topics and /modules listings.
+# Entries are (value, expiry timestamp) keyed by listing name.
+LISTING_CACHE_TTL_SECONDS = 60
+_listing_cache = {}
+_listing_cache_lock = asyncio.Lock()
+
+async def _get_cached_listing(key: str, fetch):
+    """
+    Return a cached listing if fresh, otherwise fetch and cache it.
+    The lock also collapses concurrent misses into a single DB query.
+    """
+    async with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+        if cached is not None:
+            value, expires_at = cached
+            if time.monotonic() < expires_at:
+                return value
+
+        value = await fetch()
+        # Only cache non-empty listings - the fetchers return [] on failure,
+        # and caching that would serve an empty listing for the whole TTL
+        # instead of retrying on the next request
+        if value:
+            _listing_cache[key] = (value, time.monotonic() + LISTING_CACHE_TTL_SECONDS)
+        return value
+
 async def fetch_base_question(topic: str):
     """
     Fetch base question for a topic from mainquestionbanks.
@@ -84,7 +127,12 @@ async def get_available_topics():
     """
     Get list of available interview topics.
     Returns all topics from interview_topics collection.
+    Results are cached in memory for a short TTL since topics rarely change.
     """
+    return await _get_cached_listing("topics", _fetch_available_topics)
+
+async def _fetch_available_topics():
+    """Fetch the topic listing from the database."""
     try:
         db = await get_db()
         
@@ -254,6 +302,13 @@ async def get_available_modules():
     """
     Get list of available modules for mock interviews.
     Returns all unique module codes that have questions with isAvailableForMockInterview=True (coding) or question_type="approach".
+    Results are cached in memory for a short TTL since modules rarely change.
+    """
+    return await _get_cached_listing("modules", _fetch_available_modules)
+
+async def _fetch_available_modules():
+    """
+    Fetch the module listing from the database.
     Enhanced error logging for missing data.
     """
     try:
@@ -308,18 +363,37 @@ async def get_user_name_from_id(user_id: str) -> str:
     """
     Get user name from user ID.
     Handles both ObjectId and string user IDs.
+    Names are cached in memory for an hour; use invalidate_user_name if a
+    profile name changes.
     """
+    async with _user_name_cache_lock:
+        cached = _user_name_cache.get(user_id)
+        if cached is not None:
+            user_name, expires_at = cached
+            if time.monotonic() < expires_at:
+                _user_name_cache.move_to_end(user_id)
+                return user_name
+            del _user_name_cache[user_id]
+
     try:
         db = await get_db()
-        
+
         # Convert string user_id to ObjectId if it's a valid ObjectId format
         try:
             object_id = ObjectId(user_id)
             user = await db.users.find_one({"_id": object_id})
         except:
             user = await db.users.find_one({"_id": user_id})
-        if user and "user_name" in user:
-            return user["user_name"]
-        return ""
+        user_name = user["user_name"] if user and "user_name" in user else ""
     except Exception:
-        return "" 
\ No newline at end of file
+        return ""
+
+    # Only cache successful lookups so transient failures aren't pinned
+    if user_name:
+        async with _user_name_cache_lock:
+            _user_name_cache[user_id] = (user_name, time.monotonic() + USER_NAME_CACHE_TTL_SECONDS)
+            _user_name_cache.move_to_end(user_id)
+            while len(_user_name_cache) > USER_NAME_CACHE_MAX_SIZE:
+                _user_name_cache.popitem(last=False)
+
+    return user_name 
\ No newline at end of file
@@ -84,6 +84,8 @@ async def fetch_user_history(user_id: str, limit: int = 50):
     """
     Fetch user's interaction history.
     Returns recent interactions sorted by timestamp.
+    Projects out the bulky per-session conversation blobs - the history
+    listing only needs the interaction metadata, not full transcripts.
     """
     db = await get_db()
     # Convert string user_id to ObjectId if it's a valid ObjectId format
@@ -92,10 +94,19 @@ async def fetch_user_history(user_id: str, limit: int = 50):
         query_user_id = object_id
     except:
         query_user_id = user_id
-    
-    interactions = await db.user_ai_interactions.find({
-        "user_id": query_user_id
-    }).sort("timestamp", -1).limit(limit).to_list(length=limit)
+
+    projection = {
+        "meta.session_data.questions": 0,
+        "meta.session_data.follow_up_questions": 0,
+        "meta.session_data.clarifications": 0,
+        "meta.session_data.feedback": 0,
+        "meta.session_data.rag_context": 0
+    }
+
+    interactions = await db.user_ai_interactions.find(
+        {"user_id": query_user_id},
+        projection
+    ).sort("timestamp", -1).limit(limit).to_list(length=limit)
     return interactions
 
 async def get_user_interaction_history(user_id: str, limit: int = 20):
@@ -8,14 +8,21 @@ This module handles interview feedback generation, including:
 - Feedback storage and retrieval
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional
-from services.db import get_user_name_from_id, get_enhanced_personalized_context, save_interview_feedback
-from services.llm.feedback import get_feedback
-from services.llm.utils import check_question_answered_by_id
+from typing import AsyncGenerator, Dict, Any, Optional
+from services.db import get_feedback_bootstrap, save_interview_feedback
+from services.llm.feedback import get_feedback, stream_feedback
+from services.llm.utils import parse_json_response, get_fallback_feedback
 
 logger = logging.getLogger(__name__)
 
+def _sse_event(data: Any, event: str = None) -> str:
+    """Format a payload as a server-sent event."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, default=str)}\n\n"
+
 class FeedbackService:
     """Handles interview feedback generation and management."""
     
@@ -30,34 +37,136 @@ class FeedbackService:
         if self.session_data.get("feedback"):
             return self._format_existing_feedback()
         
-        # Get user name
-        user_name = await self._get_user_name()
-        
-        # Check progress API for previous attempts
-        progress_data = await self._get_progress_data()
-        
-        # Get personalized context
-        personalized_context = await self._get_personalized_context(user_name)
-        
-        # Build conversation for feedback generation
-        conversation = self._build_conversation()
-        
-        # Prepare code data for coding interviews
-        code_data = self._prepare_code_data(code_submission)
-        
+        # Gather everything the generation step needs
+        user_name, progress_data, personalized_context, conversation, code_data = \
+            await self._prepare_feedback_inputs(code_submission)
+
         # Generate feedback
         feedback_data = await self._generate_feedback(conversation, user_name, personalized_context, code_data)
-        
+
         # Add previous attempt info if available
         if progress_data:
             feedback_data["previous_attempt"] = self._format_previous_attempt(progress_data)
-        
+
         # Save feedback to database
         await self._save_feedback(feedback_data, personalized_context)
-        
+
         # Format and return response
         return self._format_feedback_response(feedback_data)
-    
+
+    async def stream_interview_feedback(self, code_submission: Optional[Dict[str, Any]] = None) -> AsyncGenerator[str, None]:
+        """
+        Stream feedback generation as server-sent events.
+        Emits 'data' events with raw JSON fragments as the LLM produces them,
+        then a final 'complete' event with the parsed, formatted feedback.
+        Generation and persistence run in their own task: a client disconnect
+        only cancels this generator, while the task finishes the generation
+        and saves the feedback so a retry doesn't pay for it again.
+        """
+        # Existing feedback streams as a single complete event
+        if self.session_data.get("feedback"):
+            yield _sse_event(self._format_existing_feedback(), event="complete")
+            return
+
+        try:
+            user_name, progress_data, personalized_context, conversation, code_data = \
+                await self._prepare_feedback_inputs(code_submission)
+        except Exception as e:
+            logger.error(f"Error preparing feedback inputs for session {self.session_id}: {str(e)}", exc_info=True)
+            yield _sse_event({"detail": str(e)}, event="error")
+            return
+
+        # Run generate -> parse -> save as a separate task, relaying chunks
+        # through a queue; cancelling this generator leaves the task running
+        queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        generation_task = asyncio.create_task(
+            self._generate_and_save_feedback(
+                queue, user_name, progress_data, personalized_context, conversation, code_data
+            )
+        )
+
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield _sse_event({"delta": chunk})
+
+            feedback_data = await generation_task
+            yield _sse_event(self._format_feedback_response(feedback_data), event="complete")
+
+        except Exception as e:
+            logger.error(f"Error streaming feedback for session {self.session_id}: {str(e)}", exc_info=True)
+            yield _sse_event({"detail": str(e)}, event="error")
+
+    async def _generate_and_save_feedback(self, queue: "asyncio.Queue[Optional[str]]",
+                                          user_name: str, progress_data: Dict[str, Any],
+                                          personalized_context: Dict[str, Any],
+                                          conversation: list,
+                                          code_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Stream feedback chunks into the queue, then parse and persist the
+        accumulated document. Runs as its own task so it completes even if
+        the SSE consumer is cancelled mid-stream; a None sentinel tells the
+        consumer the stream has ended.
+        """
+        chunks = []
+        try:
+            async for chunk in stream_feedback(
+                conversation,
+                user_name,
+                previous_attempt=None,
+                personalized_guidance=personalized_context.get("personalized_guidance"),
+                user_patterns=personalized_context.get("user_patterns"),
+                code_data=code_data
+            ):
+                chunks.append(chunk)
+                queue.put_nowait(chunk)
+
+            # Parse the accumulated document and finish like the buffered path
+            feedback_data = parse_json_response("".join(chunks), get_fallback_feedback(user_name))
+            if "metrics" not in feedback_data:
+                feedback_data["metrics"] = {}
+
+            if progress_data:
+                feedback_data["previous_attempt"] = self._format_previous_attempt(progress_data)
+
+            await self._save_feedback(feedback_data, personalized_context)
+
+            return feedback_data
+        finally:
+            queue.put_nowait(None)
+
+    async def _prepare_feedback_inputs(self, code_submission: Optional[Dict[str, Any]]):
+        """Collect user name, progress data, context, conversation, and code data."""
+        # Fetch user name, progress data, and personalized context in one
+        # bootstrap call (single $facet aggregation + concurrent progress check)
+        bootstrap = await get_feedback_bootstrap(
+            str(self.session["user_id"]),
+            self.session_data["topic"],
+            self.session_data.get("base_question_id")
+        )
+
+        user_name = bootstrap["user_name"]
+        if not user_name:
+            logger.warning(f"User name not found for user_id: {self.session['user_id']}, using default")
+            user_name = "User"
+        self.session_data["user_name"] = user_name
+
+        progress_data = bootstrap["progress_data"]
+        personalized_context = {
+            "user_patterns": bootstrap["user_patterns"],
+            "personalized_guidance": bootstrap["personalized_guidance"]
+        }
+
+        # Build conversation for feedback generation
+        conversation = self._build_conversation()
+
+        # Prepare code data for coding interviews
+        code_data = self._prepare_code_data(code_submission)
+
+        return user_name, progress_data, personalized_context, conversation, code_data
+
     def _format_existing_feedback(self) -> Dict[str, Any]:
         """Format existing feedback for response."""
         feedback = self.session_data["feedback"]
@@ -66,57 +175,27 @@ class FeedbackService:
         
         return self._ensure_feedback_fields(feedback)
     
-    async def _get_user_name(self) -> str:
-        """Get user name from user ID."""
-        user_name = await get_user_name_from_id(str(self.session["user_id"]))
-        if not user_name:
-            logger.warning(f"User name not found for user_id: {self.session['user_id']}, using default")
-            user_name = "User"
-        
-        self.session_data["user_name"] = user_name
-        return user_name
-    
-    async def _get_progress_data(self) -> Optional[Dict[str, Any]]:
-        """Get progress data for previous attempts."""
-        base_question_id = self.session_data.get("base_question_id")
-        if base_question_id:
-            return await check_question_answered_by_id(str(self.session["user_id"]), base_question_id)
-        return None
-    
-    async def _get_personalized_context(self, user_name: str) -> Dict[str, Any]:
-        """Get personalized context for enhanced feedback."""
-        return await get_enhanced_personalized_context(
-            self.session["user_id"], 
-            self.session_data["topic"], 
-            self.session_data.get("base_question_id"),
-            user_name
-        )
-    
     def _build_conversation(self) -> list:
         """Build conversation for feedback generation."""
-        conversation = []
-        
-        if self.session_data["questions"]:
-            conversation.append({
+        base_turns = (
+            [{
                 "question": self.session_data["questions"][0]["question"],
                 "answer": self.session_data["questions"][0]["answer"]
-            })
-        
-        for q in self.session_data["follow_up_questions"]:
-            conversation.append({
-                "question": q["question"],
-                "answer": q["answer"]
-            })
-        
-        for c in self.session_data["clarifications"]:
-            conversation.append({
-                "question": f"[Clarification] {c['question']}",
-                "answer": c["answer"]
-            })
-        
+            }]
+            if self.session_data["questions"] else []
+        )
+
+        conversation = base_turns + [
+            {"question": q["question"], "answer": q["answer"]}
+            for q in self.session_data["follow_up_questions"]
+        ] + [
+            {"question": f"[Clarification] {c['question']}", "answer": c["answer"]}
+            for c in self.session_data["clarifications"]
+        ]
+
         if not conversation:
             raise ValueError("No conversation found for this session")
-        
+
         return conversation
     
     def _prepare_code_data(self, code_submission: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -160,19 +239,24 @@ class FeedbackService:
     
     async def _save_feedback(self, feedback_data: Dict[str, Any], personalized_context: Dict[str, Any]):
         """Save feedback to the database."""
-        full_feedback_data = feedback_data.copy()
-        full_feedback_data["user_patterns"] = personalized_context.get("user_patterns", {})
-        
-        await save_interview_feedback(self.session_id, full_feedback_data)
-    
+        # feedback_data is not reused elsewhere, so attach the patterns
+        # in place instead of copying the whole document
+        feedback_data["user_patterns"] = personalized_context.get("user_patterns", {})
+
+        await save_interview_feedback(self.session_id, feedback_data)
+
     def _format_feedback_response(self, feedback_data: Dict[str, Any]) -> Dict[str, Any]:
         """Format the final feedback response."""
+        # Project out user_patterns - it is persisted with the feedback but
+        # was never part of the response payload
+        response = {k: v for k, v in feedback_data.items() if k != "user_patterns"}
+
         # Add base question to response
         if self.session_data.get("questions"):
-            feedback_data["base_question"] = self.session_data["questions"][0].get("question")
-        
+            response["base_question"] = self.session_data["questions"][0].get("question")
+
         # Ensure all required fields are present
-        return self._ensure_feedback_fields(feedback_data)
+        return self._ensure_feedback_fields(response)
     
     def _ensure_feedback_fields(self, feedback: Dict[str, Any]) -> Dict[str, Any]:
         """Ensure all required feedback fields are present with default values."""
@@ -6,6 +6,7 @@ Provides AI-powered follow-up questions based on candidate responses.
 """
 
 from services.llm.utils import client, retry_with_backoff, safe_strip, get_fallback_interview_question
+from services.llm.semantic_cache import build_cache_key, get_cached_question, store_cached_question
 from openai.types.chat import (
     ChatCompletionMessageParam,
     ChatCompletionSystemMessageParam,
@@ -29,53 +30,7 @@ You are simulating a live interview session focused on evaluating:
 Your tone is professional and conversational. You ask only realistic follow-up questions based on the candidate’s responses. You never offer implementation guidance or solutions.
 """
 
-@retry_with_backoff
-async def get_next_question(
-    questions: List[Dict[str, Any]],
-    is_base_question: bool = False,
-    topic: str = "",
-    rag_context: Optional[str] = None,
-    interview_type: str = "coding"
-) -> str:
-    """
-    Generate next interview question based on conversation history.
-    Uses AI to create contextually relevant follow-up questions.
-    Supports both coding and approach interview types.
-    """
-    try:
-        # Return standard first question for base questions
-        if is_base_question:
-            return "Can you walk me through your thought process on how you would approach this problem?"
-
-        # Build conversation with system prompt and context
-        messages: List[ChatCompletionMessageParam] = [
-            ChatCompletionSystemMessageParam(role="system", content=SYSTEM_PROMPT)
-        ]
-
-        # Add RAG context if available
-        if rag_context:
-            messages.append(ChatCompletionUserMessageParam(
-                role="user",
-                content=f"Reference Context for this topic/question:\n{rag_context}"
-            ))
-        
-        # Add conversation history - properly format the messages
-        for q in questions:
-            if isinstance(q, dict) and "role" in q and "content" in q:
-                # Already properly formatted
-                messages.append(q)
-                logger.info(f"Added message to conversation: role={q['role']}, content={q['content'][:100]}...")
-            else:
-                # Handle legacy format or malformed messages
-                logger.warning(f"Skipping malformed message: {q}")
-                continue
-
-        logger.info(f"Total messages in conversation: {len(messages)}")
-        logger.info(f"Messages: {[{'role': m.get('role'), 'content': m.get('content', '')[:50]} for m in messages]}")
-
-        # Add instruction for follow-up question generation with interview type context
-        if interview_type in ["multi-line", "case-study", "approach"]:
-            instruction = """This is a NON-CODING interview (multi-line / case-study / approach / verbal reasoning phase).
+NON_CODING_INSTRUCTION = """This is a NON-CODING interview (multi-line / case-study / approach / verbal reasoning phase).
 
                             Ask a follow-up question that:
                             1. Probes deeper into the candidate's reasoning, explanation, or application
@@ -98,8 +53,8 @@ async def get_next_question(
 
                             Your follow-up should test understanding and clarity, not implementation skill.
                             """
-        else:
-            instruction = """This is the VERBAL PHASE of a CODING interview.
+
+CODING_INSTRUCTION = """This is the VERBAL PHASE of a CODING interview.
 
                             Ask a follow-up question that:
                             1. Digs deeper into the candidate's understanding of the problem requirements
@@ -121,8 +76,72 @@ async def get_next_question(
                             The question should assess problem understanding and business logic—not technical implementation or programming skills.
                             """
 
-        messages.append(ChatCompletionUserMessageParam(role="user", content=instruction))
-        logger.info(f"Added instruction for {interview_type} interview type")
+def build_static_prompt_prefix(rag_context: Optional[str], interview_type: str) -> str:
+    """
+    Build the static portion of the prompt for a given topic and interview type.
+    The result is byte-identical across calls with the same inputs so that
+    backend prompt caching (prefix/KV caching) can reuse the prefill work.
+    Dynamic conversation turns must always come after this prefix.
+    """
+    if interview_type in ["multi-line", "case-study", "approach"]:
+        instruction = NON_CODING_INSTRUCTION
+    else:
+        instruction = CODING_INSTRUCTION
+
+    parts = [SYSTEM_PROMPT.strip(), instruction]
+    if rag_context:
+        parts.append(f"Reference Context for this topic/question:\n{rag_context}")
+
+    return "\n\n".join(parts)
+
+@retry_with_backoff
+async def get_next_question(
+    questions: List[Dict[str, Any]],
+    is_base_question: bool = False,
+    topic: str = "",
+    rag_context: Optional[str] = None,
+    interview_type: str = "coding"
+) -> str:
+    """
+    Generate next interview question based on conversation history.
+    Uses AI to create contextually relevant follow-up questions.
+    Supports both coding and approach interview types.
+    """
+    try:
+        # Return standard first question for base questions
+        if is_base_question:
+            return "Can you walk me through your thought process on how you would approach this problem?"
+
+        # Probe the semantic cache before paying for an LLM call; keep the
+        # key embedding so a miss can be stored without re-embedding
+        cache_key = build_cache_key(topic, questions, interview_type)
+        cached_question, cache_key_embedding = await get_cached_question(cache_key)
+        if cached_question:
+            return cached_question
+
+        # Build conversation with the static prefix first so the system prompt,
+        # instruction, and RAG context form an identical prefix across calls for
+        # the same topic - only the conversation turns below vary per request
+        messages: List[ChatCompletionMessageParam] = [
+            ChatCompletionSystemMessageParam(
+                role="system",
+                content=build_static_prompt_prefix(rag_context, interview_type)
+            )
+        ]
+
+        # Add conversation history - properly format the messages
+        for q in questions:
+            if isinstance(q, dict) and "role" in q and "content" in q:
+                # Already properly formatted
+                messages.append(q)
+                logger.info(f"Added message to conversation: role={q['role']}, content={q['content'][:100]}...")
+            else:
+                # Handle legacy format or malformed messages
+                logger.warning(f"Skipping malformed message: {q}")
+                continue
+
+        logger.info(f"Total messages in conversation: {len(messages)}")
+        logger.info(f"Messages: {[{'role': m.get('role'), 'content': m.get('content', '')[:50]} for m in messages]}")
 
         # Generate next question using AI
         logger.info(f"Calling OpenAI API with {len(messages)} messages")
@@ -143,6 +162,11 @@ async def get_next_question(
         
         final_content = content or get_fallback_interview_question()
         logger.info(f"Final question: {final_content[:200]}...")
+
+        # Cache the generated question for semantically similar future contexts
+        if content:
+            await store_cached_question(cache_key, final_content, cache_key_embedding)
+
         return final_content
 
     except Exception as e:
@@ -8,6 +8,8 @@ This module handles the core interview flow logic, including:
 - Clarification management
 """
 
+import asyncio
+import itertools
 import logging
 from typing import Dict, Any, Optional, Tuple
 from services.llm.check_answer_quality import check_single_answer_quality
@@ -24,6 +26,12 @@ CLARIFICATION_LIMITS = {
     "warn_at_percentage": 0.8   # Warn user when they reach 80% of limit
 }
 
+# Configuration for conversation history compaction
+HISTORY_COMPACTION = {
+    "max_messages": 4,          # Trailing messages sent verbatim (two Q/A turns)
+    "summary_answer_chars": 300 # Max characters of the last summarized answer
+}
+
 class InterviewFlowManager:
     """Manages interview flow logic and state transitions."""
     
@@ -77,18 +85,46 @@ class InterviewFlowManager:
         """Process user answer and determine next action."""
         # Get last answered question
         last_answered_question = self._get_last_answered_question()
-        
-        # Check answer quality
-        quality = await self._assess_answer_quality(last_answered_question, rag_context)
-        
-        # Handle clarification limits
-        quality = await self._handle_clarification_limits(quality, last_answered_question)
-        
-        # Process based on interview type and quality
-        if self.interview_type == "coding":
-            return await self._handle_coding_interview_flow(quality, last_answered_question, rag_context)
-        else:
-            return await self._handle_approach_interview_flow(quality, last_answered_question, rag_context)
+
+        # Speculatively start next-question generation so it overlaps the quality
+        # check - both are independent LLM calls, and quality is "good" on the
+        # common path. The task is discarded if quality turns out "bad".
+        # The question counts come straight from session_data, so we know up
+        # front whether this turn can ask another question at all; on the
+        # transition turn no branch consumes the task, so don't start it.
+        next_question_task = None
+        if self._will_ask_another_question():
+            next_question_task = asyncio.create_task(
+                get_next_question(
+                    self._compact_conversation_history(self._build_conversation_history()),
+                    topic=self.session_data["topic"],
+                    rag_context=rag_context,
+                    interview_type=self.interview_type
+                )
+            )
+
+        try:
+            # Check answer quality
+            quality = await self._assess_answer_quality(last_answered_question, rag_context)
+
+            # Handle clarification limits
+            quality = await self._handle_clarification_limits(quality, last_answered_question)
+
+            # A bad answer means no branch will consume the speculative
+            # question - cancel it now, before the rejection-feedback LLM
+            # call gives it time to run to completion
+            if quality == "bad" and next_question_task is not None:
+                next_question_task.cancel()
+
+            # Process based on interview type and quality
+            if self.interview_type == "coding":
+                return await self._handle_coding_interview_flow(quality, last_answered_question, next_question_task)
+            else:
+                return await self._handle_approach_interview_flow(quality, last_answered_question, next_question_task)
+        finally:
+            # Cancel the speculative generation if no branch consumed it
+            if next_question_task is not None and not next_question_task.done():
+                next_question_task.cancel()
     
     def _get_last_answered_question(self) -> Dict[str, Any]:
         """Get the last question that was answered by the user."""
@@ -124,16 +160,13 @@ class InterviewFlowManager:
         
         return quality
     
-    async def _handle_coding_interview_flow(self, quality: str, question_data: Dict[str, Any], rag_context: str) -> Dict[str, Any]:
+    async def _handle_coding_interview_flow(self, quality: str, question_data: Dict[str, Any], next_question_task: "Optional[asyncio.Task[str]]") -> Dict[str, Any]:
         """Handle coding interview flow logic."""
         if quality == "bad":
             return await self._generate_coding_feedback(question_data)
-        
-        # Count properly answered questions
-        properly_answered_questions = self._count_properly_answered_questions()
-        
-        if properly_answered_questions < 5:
-            return await self._generate_next_question(rag_context)
+
+        if self._will_ask_another_question():
+            return await self._generate_next_question(next_question_task)
         else:
             await transition_to_coding_phase(self.session_id)
             return {
@@ -142,16 +175,13 @@ class InterviewFlowManager:
                 "ready_to_code": True
             }
     
-    async def _handle_approach_interview_flow(self, quality: str, question_data: Dict[str, Any], rag_context: str) -> Dict[str, Any]:
+    async def _handle_approach_interview_flow(self, quality: str, question_data: Dict[str, Any], next_question_task: "Optional[asyncio.Task[str]]") -> Dict[str, Any]:
         """Handle approach interview flow logic."""
         if quality == "bad":
             return await self._generate_approach_feedback(question_data)
-        
-        # Count answered questions
-        properly_answered_questions = sum(1 for q in self.session_data["follow_up_questions"] if q.get("answer"))
-        
-        if properly_answered_questions < 7:
-            return await self._generate_next_question(rag_context)
+
+        if self._will_ask_another_question():
+            return await self._generate_next_question(next_question_task)
         else:
             return {
                 "question": "Great discussion! You can submit the session and check your feedback.",
@@ -160,20 +190,22 @@ class InterviewFlowManager:
     
     def _count_properly_answered_questions(self) -> int:
         """Count questions that were properly answered (not clarifications)."""
-        return sum(1 for q in self.session_data["follow_up_questions"] 
+        return sum(1 for q in self.session_data["follow_up_questions"]
                   if q.get("answer") and q.get("clarification_count", 0) == 0)
-    
-    async def _generate_next_question(self, rag_context: str) -> Dict[str, Any]:
-        """Generate the next follow-up question."""
-        conversation_history = self._build_conversation_history()
-        
-        next_question = await get_next_question(
-            conversation_history, 
-            topic=self.session_data["topic"], 
-            rag_context=rag_context, 
-            interview_type=self.interview_type
-        )
-        
+
+    def _will_ask_another_question(self) -> bool:
+        """
+        Whether a good answer on this turn leads to another follow-up question,
+        as opposed to transitioning to coding or completing the session.
+        """
+        if self.interview_type == "coding":
+            return self._count_properly_answered_questions() < 5
+        return sum(1 for q in self.session_data["follow_up_questions"] if q.get("answer")) < 7
+
+    async def _generate_next_question(self, next_question_task: "Optional[asyncio.Task[str]]") -> Dict[str, Any]:
+        """Await the speculatively generated follow-up question and persist it."""
+        next_question = await next_question_task
+
         await add_follow_up_question(self.session_id, next_question)
         
         return {
@@ -183,19 +215,47 @@ class InterviewFlowManager:
     
     def _build_conversation_history(self) -> list:
         """Build conversation history for next question generation."""
-        conversation_history = []
-        
-        if self.session_data.get("questions"):
-            base_question = self.session_data["questions"][0]
-            conversation_history.append({"role": "assistant", "content": base_question["question"]})
-        
-        for q in self.session_data["follow_up_questions"]:
-            conversation_history.append({"role": "assistant", "content": q["question"]})
-            if q.get("answer"):
-                conversation_history.append({"role": "user", "content": q["answer"]})
-        
-        return conversation_history
+        base_messages = (
+            [{"role": "assistant", "content": self.session_data["questions"][0]["question"]}]
+            if self.session_data.get("questions") else []
+        )
+
+        return base_messages + list(itertools.chain.from_iterable(
+            [{"role": "assistant", "content": q["question"]}]
+            + ([{"role": "user", "content": q["answer"]}] if q.get("answer") else [])
+            for q in self.session_data["follow_up_questions"]
+        ))
     
+    def _compact_conversation_history(self, conversation_history: list) -> list:
+        """
+        Cap the history sent to the LLM at the last few turns plus a summary.
+        Re-sending the full transcript makes input tokens grow quadratically
+        across a session's follow-up calls; recent turns carry nearly all the
+        signal the next question needs.
+        """
+        max_messages = HISTORY_COMPACTION["max_messages"]
+        if len(conversation_history) <= max_messages + 1:
+            return conversation_history
+
+        older_messages = conversation_history[:-max_messages]
+        questions_asked = sum(1 for m in older_messages if m.get("role") == "assistant")
+        last_older_answer = next(
+            (m["content"] for m in reversed(older_messages) if m.get("role") == "user"),
+            ""
+        )
+
+        summary = (
+            f"[Conversation summary] {questions_asked} earlier question(s) on "
+            f"{self.session_data['topic']} have already been asked and answered."
+        )
+        if last_older_answer:
+            summary += (
+                " The candidate's most recent earlier answer was: "
+                f"\"{last_older_answer[:HISTORY_COMPACTION['summary_answer_chars']]}\""
+            )
+
+        return [{"role": "user", "content": summary}] + conversation_history[-max_messages:]
+
     async def _generate_coding_feedback(self, question_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate feedback for coding interview with bad answer quality."""
         feedback_message = await self._generate_dynamic_feedback(question_data)
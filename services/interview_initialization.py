@@ -8,12 +8,13 @@ This module handles interview session initialization, including:
 - Session storage
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import ulid
 from typing import Dict, Any
 from services.db import create_interview_session, get_user_name_from_id, validate_user_id
 from services.interview import get_next_question
-from services.rag.retriever_factory import get_rag_retriever
+from services.rag.context_cache import get_cached_rag_context
 from services.db import fetch_question_by_module
 
 logger = logging.getLogger(__name__)
@@ -31,20 +32,23 @@ class InterviewInitializer:
         if not await validate_user_id(self.user_id):
             raise ValueError("User not found")
         
-        # Create unique session ID
-        session_id = f"{self.user_id}_{self.module_code}_{datetime.now().timestamp()}"
-        
-        # Fetch question by module code
-        base_question_data = await fetch_question_by_module(self.module_code, attempted_questions=[])
-        
-        # Get RAG context for better question generation
-        rag_context = await self._get_rag_context()
-        
+        # Create unique session ID - ULIDs are monotonic, collision-safe under
+        # burst traffic, and lexicographically sortable by creation time
+        session_id = f"{self.user_id}_{self.module_code}_{ulid.new().str}"
+
+        # Fetch question, RAG context, and user name concurrently - all three
+        # are independent I/O calls
+        base_question_data, rag_context, user_name = await asyncio.gather(
+            fetch_question_by_module(self.module_code, attempted_questions=[]),
+            self._get_rag_context(),
+            get_user_name_from_id(self.user_id)
+        )
+
         # Generate first follow-up question
         first_follow_up = await self._generate_first_follow_up(base_question_data, rag_context)
-        
+
         # Create interview session in database
-        await self._create_session(session_id, base_question_data, first_follow_up)
+        await self._create_session(session_id, base_question_data, first_follow_up, user_name, rag_context)
         
         # Build response
         return self._build_response(session_id, base_question_data, first_follow_up)
@@ -52,13 +56,10 @@ class InterviewInitializer:
     async def _get_rag_context(self) -> str:
         """Get RAG context for the module."""
         try:
-            retriever = await get_rag_retriever()
-            if retriever is not None:
-                context_chunks = await retriever.retrieve_context(self.module_code)
-                return "\n\n".join(context_chunks)
+            return await get_cached_rag_context(self.module_code)
         except Exception as e:
             logger.warning(f"Failed to get RAG context: {e}")
-        
+
         return ""
     
     async def _generate_first_follow_up(self, base_question_data: Dict[str, Any], rag_context: str) -> str:
@@ -75,11 +76,9 @@ class InterviewInitializer:
             logger.error(f"Error generating follow-up question: {str(e)}", exc_info=True)
             raise RuntimeError(f"Error generating follow-up question: {str(e)}")
     
-    async def _create_session(self, session_id: str, base_question_data: Dict[str, Any], first_follow_up: str):
+    async def _create_session(self, session_id: str, base_question_data: Dict[str, Any], first_follow_up: str, user_name: str, rag_context: str = ""):
         """Create the interview session in the database."""
         try:
-            user_name = await get_user_name_from_id(self.user_id)
-            
             # Debug logging for interview type
             logger.info(f"Creating session with interview_type: {base_question_data.get('interview_type')}")
             logger.info(f"Base question data keys: {list(base_question_data.keys())}")
@@ -91,7 +90,8 @@ class InterviewInitializer:
                 user_name=user_name,
                 base_question_data=base_question_data,
                 first_follow_up=first_follow_up,
-                base_question_id=str(base_question_data["_id"])
+                base_question_id=str(base_question_data["_id"]),
+                rag_context=rag_context
             )
             logger.info(f"Successfully created interview session: {session_id}")
         except Exception as e:
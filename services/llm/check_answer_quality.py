@@ -11,6 +11,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Common stopwords for the trivial-answer prefilter - an answer made up
+# entirely of these carries no technical content worth an LLM round-trip
+STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "can", "could",
+    "do", "does", "for", "from", "had", "has", "have", "he", "her", "his",
+    "i", "if", "in", "is", "it", "its", "just", "me", "my", "no", "not",
+    "of", "on", "or", "our", "she", "so", "that", "the", "their", "them",
+    "then", "there", "they", "this", "to", "too", "was", "we", "were",
+    "what", "when", "where", "which", "who", "why", "will", "with", "would",
+    "you", "your"
+])
+
 @retry_with_backoff
 async def check_answer_quality(questions: List[Dict[str, Any]], topic: str) -> str:
     """
@@ -59,7 +71,15 @@ async def check_single_answer_quality(question: str, answer: str, topic: str, ra
     try:
         # Pre-filter obviously good answers to avoid unnecessary AI calls
         answer_text = answer.strip().lower()
-        
+
+        # Fast prefilter: empty or all-stopword answers are trivially bad and
+        # don't warrant an LLM round-trip
+        if not answer_text:
+            return "bad"
+        answer_words = set(answer_text.replace(",", " ").replace(".", " ").split())
+        if answer_words and answer_words.issubset(STOPWORDS):
+            return "bad"
+
         # If answer is too short, check if it's meaningful
         if len(answer_text) < 15:
             # Check if it's a meaningful short answer
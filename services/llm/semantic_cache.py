@@ -0,0 +1,137 @@
+"""
+Semantic Cache Module
+
+This module provides an embedding-similarity cache for generated follow-up questions.
+Near-identical (topic, recent conversation) contexts recur across users, so
+semantically similar prompts can reuse a previously generated question instead of
+paying for a fresh LLM call. Entries live in a dedicated Qdrant collection and
+are matched by cosine similarity above a high threshold.
+"""
+
+import logging
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from services.rag.embedding import get_embedding
+from services.rag.qdrant_client import client as qdrant_client
+
+logger = logging.getLogger(__name__)
+
+# Cache configuration
+CACHE_COLLECTION_NAME = "question_cache"
+SIMILARITY_THRESHOLD = 0.95
+EMBEDDING_DIMENSION = 1536  # OpenAI text-embedding-ada-002 dimension
+CONTEXT_TURNS = 2  # Number of trailing conversation turns included in the cache key
+
+# Tracks whether the cache collection has been verified/created this process
+_collection_ready = False
+
+def build_cache_key(topic: str, conversation: List[Dict[str, str]], interview_type: str = "coding") -> str:
+    """
+    Build the text that gets embedded as the cache key.
+    Uses the topic, interview type, and the last few conversation turns so that
+    sessions at the same point of a similar discussion hash close together.
+    """
+    recent_turns = [
+        f"{m.get('role', '')}: {m.get('content', '')}"
+        for m in conversation[-CONTEXT_TURNS * 2:]
+        if isinstance(m, dict) and m.get("content")
+    ]
+    return "\n".join([f"topic: {topic}", f"interview_type: {interview_type}"] + recent_turns)
+
+async def _ensure_collection():
+    """
+    Create the question cache collection in Qdrant if it doesn't exist.
+    Only checked once per process.
+    """
+    global _collection_ready
+    if _collection_ready:
+        return
+
+    collections = await qdrant_client.get_collections()
+    collection_names = [col.name for col in collections.collections]
+
+    if CACHE_COLLECTION_NAME not in collection_names:
+        logger.info(f"Creating semantic cache collection: {CACHE_COLLECTION_NAME}")
+        await qdrant_client.create_collection(
+            collection_name=CACHE_COLLECTION_NAME,
+            vectors_config={
+                "size": EMBEDDING_DIMENSION,
+                "distance": "Cosine"
+            }
+        )
+
+    _collection_ready = True
+
+async def get_cached_question(cache_key: str) -> Tuple[Optional[str], Optional[List[float]]]:
+    """
+    Probe the semantic cache for a previously generated question.
+
+    Args:
+        cache_key (str): Cache key text from build_cache_key
+
+    Returns:
+        Tuple[Optional[str], Optional[List[float]]]: The cached question on a
+        similarity hit (None on miss or failure), plus the key embedding so a
+        miss can be stored via store_cached_question without re-embedding.
+    """
+    key_embedding = None
+    try:
+        await _ensure_collection()
+
+        key_embedding = await get_embedding(cache_key)
+        if not key_embedding:
+            return None, None
+
+        search_result = await qdrant_client.search(
+            collection_name=CACHE_COLLECTION_NAME,
+            query_vector=key_embedding,
+            limit=1,
+            score_threshold=SIMILARITY_THRESHOLD
+        )
+
+        if search_result:
+            hit = search_result[0]
+            if hit.payload and "question" in hit.payload:
+                logger.info(f"Semantic cache hit (score: {hit.score:.3f})")
+                return hit.payload["question"], key_embedding
+
+        return None, key_embedding
+
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed: {e}")
+        return None, key_embedding
+
+async def store_cached_question(cache_key: str, question: str, key_embedding: Optional[List[float]] = None):
+    """
+    Store a generated question in the semantic cache.
+    Pass the key embedding returned by get_cached_question to avoid embedding
+    the same key twice; it is only recomputed when not provided.
+    Failures are logged and swallowed so caching never breaks question generation.
+    """
+    try:
+        await _ensure_collection()
+
+        if not key_embedding:
+            key_embedding = await get_embedding(cache_key)
+        if not key_embedding:
+            return
+
+        await qdrant_client.upsert(
+            collection_name=CACHE_COLLECTION_NAME,
+            points=[
+                {
+                    "id": str(uuid.uuid4()),
+                    "vector": key_embedding,
+                    "payload": {
+                        "question": question,
+                        "created_at": time.time()
+                    }
+                }
+            ]
+        )
+        logger.info("Stored generated question in semantic cache")
+
+    except Exception as e:
+        logger.warning(f"Semantic cache store failed: {e}")
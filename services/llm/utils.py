@@ -14,6 +14,7 @@ from functools import wraps
 import asyncio
 import json
 import tiktoken
+from string import Template
 from dotenv import load_dotenv
 import httpx
 load_dotenv()
@@ -37,6 +38,38 @@ MODEL_NAME = "gpt-4o-mini-2024-07-18"
 
 PROGRESS_API_BASE_URL = os.getenv("PROGRESS_API_BASE_URL")
 
+# === Prompt Templates ===
+# Per-feedback-type prompts for generate_dynamic_feedback, precompiled at
+# import time so the per-request path only does a substitute() call instead
+# of rebuilding the prompt string
+_DYNAMIC_FEEDBACK_TEMPLATES = {
+    "gibberish": Template("""You are a technical interviewer. The candidate gave this answer: "$answer"
+
+This answer appears to be random characters or doesn't address the question. Provide a brief, encouraging response (1-2 sentences max) asking them to explain what they think the problem is asking for.
+
+Keep it conversational and natural, like a real interviewer would speak."""),
+    "brief": Template("""You are a technical interviewer. The candidate gave this brief answer: "$answer"
+
+Provide a brief, encouraging response (1-2 sentences max) asking them to elaborate more on their understanding of the problem.
+
+Keep it conversational and natural, like a real interviewer would speak."""),
+    "uncertain": Template("""You are a technical interviewer. The candidate seems uncertain about: "$answer"
+
+Provide a brief, encouraging response (1-2 sentences max) that acknowledges their uncertainty but asks them to share their initial thoughts.
+
+Keep it conversational and natural, like a real interviewer would speak."""),
+    "yes_no": Template("""You are a technical interviewer. The candidate gave a simple yes/no answer: "$answer"
+
+Provide a brief, encouraging response (1-2 sentences max) asking them to explain their reasoning.
+
+Keep it conversational and natural, like a real interviewer would speak."""),
+    "general": Template("""You are a technical interviewer. The candidate's answer could be improved: "$answer"
+
+Provide a brief, encouraging response (1-2 sentences max) asking them to focus more on the specific question.
+
+Keep it conversational and natural, like a real interviewer would speak."""),
+}
+
 def get_token_count(text: str, model: str = "cl100k_base") -> int:
     """
     Count tokens in text using tiktoken.
@@ -444,41 +477,9 @@ async def generate_dynamic_feedback(question: str, answer: str, topic: str = Non
     Uses focused prompts to create natural, interview-like responses.
     """
     try:
-        # Different prompts based on feedback type
-        if feedback_type == "gibberish":
-            prompt = f"""You are a technical interviewer. The candidate gave this answer: "{answer}"
-
-This answer appears to be random characters or doesn't address the question. Provide a brief, encouraging response (1-2 sentences max) asking them to explain what they think the problem is asking for.
-
-Keep it conversational and natural, like a real interviewer would speak."""
-        
-        elif feedback_type == "brief":
-            prompt = f"""You are a technical interviewer. The candidate gave this brief answer: "{answer}"
-
-Provide a brief, encouraging response (1-2 sentences max) asking them to elaborate more on their understanding of the problem.
-
-Keep it conversational and natural, like a real interviewer would speak."""
-        
-        elif feedback_type == "uncertain":
-            prompt = f"""You are a technical interviewer. The candidate seems uncertain about: "{answer}"
-
-Provide a brief, encouraging response (1-2 sentences max) that acknowledges their uncertainty but asks them to share their initial thoughts.
-
-Keep it conversational and natural, like a real interviewer would speak."""
-        
-        elif feedback_type == "yes_no":
-            prompt = f"""You are a technical interviewer. The candidate gave a simple yes/no answer: "{answer}"
-
-Provide a brief, encouraging response (1-2 sentences max) asking them to explain their reasoning.
-
-Keep it conversational and natural, like a real interviewer would speak."""
-        
-        else:  # general
-            prompt = f"""You are a technical interviewer. The candidate's answer could be improved: "{answer}"
-
-Provide a brief, encouraging response (1-2 sentences max) asking them to focus more on the specific question.
-
-Keep it conversational and natural, like a real interviewer would speak."""
+        # Pick the precompiled prompt template for this feedback type
+        template = _DYNAMIC_FEEDBACK_TEMPLATES.get(feedback_type, _DYNAMIC_FEEDBACK_TEMPLATES["general"])
+        prompt = template.substitute(answer=answer)
 
         response = await client.chat.completions.create(
             model=MODEL_NAME,
@@ -8,9 +8,12 @@ Handles document loading, embedding generation, and intelligent retrieval.
 from .retriever import RAGRetriever
 from .embedding import get_embedding
 from .doc_loader import load_docx_files
+from .context_cache import get_cached_rag_context, bump_corpus_version
 
 __all__ = [
     "RAGRetriever",
     "get_embedding",
-    "load_docx_files"
+    "load_docx_files",
+    "get_cached_rag_context",
+    "bump_corpus_version"
 ]
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+RAG Context Cache Module
+
+This module provides an in-process TTL + LRU cache for retrieved RAG context.
+The same topics recur across many sessions, so reusing the joined context string
+avoids one embedding call and one Qdrant search per request on a cache hit.
+The corpus is stable between re-uploads, so invalidation is handled by bumping
+a corpus version (on re-ingest) rather than per-query.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from services.rag.retriever_factory import get_rag_retriever
+
+logger = logging.getLogger(__name__)
+
+# Cache configuration
+CACHE_MAX_SIZE = 256
+CACHE_TTL_SECONDS = 600  # 10 minutes
+
+# Cache state: key -> (joined context string, expiry timestamp)
+_cache: "OrderedDict[Tuple[str, int, int], Tuple[str, float]]" = OrderedDict()
+_cache_lock = asyncio.Lock()
+
+# Bumped when the underlying Qdrant corpus is re-ingested
+_corpus_version = 0
+
+def bump_corpus_version():
+    """
+    Invalidate all cached context after a corpus re-upload.
+    Old entries become unreachable because the version is part of the cache key.
+    """
+    global _corpus_version
+    _corpus_version += 1
+    logger.info(f"RAG context cache invalidated (corpus version: {_corpus_version})")
+
+async def get_cached_rag_context(topic: str, top_k: int = 3) -> str:
+    """
+    Get the joined RAG context for a topic, using the in-process cache when possible.
+    Falls back to a live retrieve on miss or expiry and stores the result.
+
+    Args:
+        topic (str): Topic or module code to retrieve context for
+        top_k (int): Number of chunks to retrieve on a cache miss
+
+    Returns:
+        str: Joined context chunks, or empty string if retrieval fails
+    """
+    key = (topic.strip().lower(), top_k, _corpus_version)
+
+    async with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            context, expires_at = cached
+            if time.monotonic() < expires_at:
+                _cache.move_to_end(key)
+                logger.info(f"RAG context cache hit for topic: {topic[:100]}")
+                return context
+            del _cache[key]
+
+    # Cache miss - retrieve from Qdrant
+    context = await _retrieve_context(topic, top_k)
+
+    # Only cache successful retrievals - an empty context means the lookup
+    # failed or found nothing, and caching it would pin the failure for the
+    # whole TTL instead of retrying on the next request
+    if context:
+        async with _cache_lock:
+            _cache[key] = (context, time.monotonic() + CACHE_TTL_SECONDS)
+            _cache.move_to_end(key)
+            while len(_cache) > CACHE_MAX_SIZE:
+                _cache.popitem(last=False)
+
+    return context
+
+async def _retrieve_context(topic: str, top_k: int) -> str:
+    """
+    Retrieve and join context chunks from the RAG retriever.
+    Returns empty string on failure so callers degrade gracefully.
+    """
+    try:
+        retriever = await get_rag_retriever()
+        if retriever is not None:
+            context_chunks = await retriever.retrieve_context(topic, top_k=top_k)
+            return "\n\n".join(context_chunks)
+    except Exception as e:
+        logger.warning(f"Failed to get RAG context: {e}")
+
+    return ""
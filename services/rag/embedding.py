@@ -3,12 +3,17 @@ Embedding Generation Module
 
 This module handles text embedding generation using OpenAI's embedding API.
 Provides functions for converting text to vector representations for RAG.
+
+Concurrent callers are micro-batched: requests arriving within a short
+window are grouped into a single embeddings API call, since the API
+accepts a list of inputs and charges per call as well as per token.
 """
 
 from openai import AsyncOpenAI
+import asyncio
 import os
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -23,28 +28,80 @@ except ImportError:
         raise ValueError("OPENAI_API_KEY must be set for embedding generation")
     shared_client = AsyncOpenAI(api_key=openai_api_key)
 
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Micro-batching: flush pending requests once this many have queued up,
+# or after the window elapses, whichever comes first
+BATCH_MAX_SIZE = 32
+BATCH_WINDOW_SECONDS = 0.005
+
+# Pending (text, future) pairs awaiting the next flush. Only touched from
+# the event loop, so no lock is needed.
+_pending: List[Tuple[str, asyncio.Future]] = []
+_flush_task: Optional[asyncio.Task] = None
+
+async def _flush_pending():
+    """
+    Send all queued texts in one embeddings API call and resolve the
+    futures of the callers waiting on them.
+    """
+    global _pending, _flush_task
+    batch, _pending = _pending, []
+    _flush_task = None
+    if not batch:
+        return
+
+    try:
+        response = await shared_client.embeddings.create(
+            input=[text for text, _ in batch],
+            model=EMBEDDING_MODEL
+        )
+
+        if response and response.data and len(response.data) == len(batch):
+            for item, (_, future) in zip(response.data, batch):
+                if not future.done():
+                    future.set_result(item.embedding)
+            return
+
+        logger.warning("Embeddings API returned unexpected data for batch")
+        for _, future in batch:
+            if not future.done():
+                future.set_result([])
+
+    except Exception as e:
+        logger.error(f"Error generating embedding batch: {str(e)}")
+        for _, future in batch:
+            if not future.done():
+                future.set_result([])
+
+async def _flush_after_window():
+    """Flush the queue once the batching window has elapsed."""
+    await asyncio.sleep(BATCH_WINDOW_SECONDS)
+    await _flush_pending()
+
 async def get_embedding(text: str) -> List[float]:
     """
     Generate embedding for given text using OpenAI's text-embedding-ada-002 model.
-    
+
+    Requests are queued briefly so concurrent callers share one API call.
+
     Args:
         text (str): Input text to embed
-        
+
     Returns:
         List[float]: Embedding vector or empty list on failure
     """
-    try:
-        response = await shared_client.embeddings.create(
-            input=text,
-            model="text-embedding-ada-002"
-        )
-        
-        if response and response.data and len(response.data) > 0:
-            return response.data[0].embedding
-        else:
-            logger.warning("Empty data returned from OpenAI embeddings API")
-            return []
-    
-    except Exception as e:
-        logger.error(f"Error generating embedding: {str(e)}")
-        return []
\ No newline at end of file
+    global _flush_task
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _pending.append((text, future))
+
+    if len(_pending) >= BATCH_MAX_SIZE:
+        # Full batch - flush now instead of waiting out the window
+        if _flush_task is not None:
+            _flush_task.cancel()
+            _flush_task = None
+        await _flush_pending()
+    elif _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_after_window())
+
+    return await future
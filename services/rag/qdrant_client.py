@@ -3,10 +3,13 @@ Qdrant Vector Database Client Module
 
 This module provides connection to Qdrant vector database for RAG operations.
 Handles vector storage and retrieval for document embeddings.
+A single AsyncQdrantClient is created at import time and shared process-wide,
+so every caller reuses the same pooled HTTP connections instead of paying a
+TLS handshake per request.
 """
 
 import os
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 
 # Get Qdrant configuration from environment variables
 QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
@@ -15,8 +18,8 @@ QDRANT_URL = os.getenv("QDRANT_URL")
 if not QDRANT_URL:
     raise ValueError("QDRANT_URL must be set in environment variables.")
 
-# Initialize Qdrant client
-client = QdrantClient(
+# Initialize shared async Qdrant client
+client = AsyncQdrantClient(
     url=QDRANT_URL,
     api_key=QDRANT_API_KEY,
-)
\ No newline at end of file
+)
@@ -48,7 +48,7 @@ class RAGRetriever:
                 return []
 
             # Search Qdrant collection
-            search_result = qdrant_client.search(
+            search_result = await qdrant_client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
                 limit=top_k
@@ -11,8 +11,8 @@ This module handles user session management, including:
 import logging
 from typing import Dict, Any, List
 from services.db import (
-    get_user_interview_sessions, 
-    get_user_name_from_id, 
+    get_user_interview_session_summaries,
+    get_user_name_from_id,
     get_enhanced_personalized_context,
     validate_user_id
 )
@@ -30,24 +30,26 @@ class UserSessionService:
         if not await validate_user_id(self.user_id):
             raise ValueError("User not found")
         
-        sessions = await get_user_interview_sessions(self.user_id, limit)
-        
+        # Summaries are shaped server-side, so only the fields below are
+        # transferred instead of the full session documents
+        sessions = await get_user_interview_session_summaries(self.user_id, limit)
+
         # Format response with session metadata
-        formatted_sessions = []
-        for session in sessions:
-            session_data = session["meta"]["session_data"]
-            formatted_sessions.append({
+        formatted_sessions = [
+            {
                 "session_id": session["session_id"],
-                "topic": session_data["topic"],
-                "user_name": session_data["user_name"],
-                "status": session_data["status"],
-                "current_phase": session_data["current_phase"],
-                "total_questions": session_data["total_questions"],
+                "topic": session.get("topic"),
+                "user_name": session.get("user_name"),
+                "status": session.get("status"),
+                "current_phase": session.get("current_phase"),
+                "total_questions": session.get("total_questions"),
                 "created_at": session["timestamp"],
                 "updated_at": session["timestamp"],
-                "has_feedback": session_data.get("feedback") is not None
-            })
-        
+                "has_feedback": session.get("has_feedback", False)
+            }
+            for session in sessions
+        ]
+
         return {"sessions": formatted_sessions}
     
     async def get_user_session_detail(self, session_id: str) -> Dict[str, Any]:
@@ -31,7 +31,7 @@ async def verify_collection():
         collection_name = "docs"
         
         # Check if collection exists
-        collections = qdrant_client.get_collections()
+        collections = await qdrant_client.get_collections()
         collection_names = [col.name for col in collections.collections]
         
         if collection_name not in collection_names:
@@ -41,7 +41,7 @@ async def verify_collection():
         logger.info(f"✅ Collection '{collection_name}' exists")
         
         # Get collection info
-        collection_info = qdrant_client.get_collection(collection_name)
+        collection_info = await qdrant_client.get_collection(collection_name)
         points_count = collection_info.points_count
         
         logger.info(f"📊 Collection has {points_count} points (chunks)")